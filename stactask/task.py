@@ -65,6 +65,8 @@ class Task(ABC):
     description = "A task for doing things"
     version = "0.1.0"
 
+    _parser: Optional[argparse.ArgumentParser] = None
+
     def __init__(
         self: "Task",
         payload: dict[str, Any],
@@ -459,7 +461,15 @@ class Task(ABC):
                 task.cleanup_workdir()
 
     @classmethod
-    def parse_args(cls, args: list[str]) -> dict[str, Any]:
+    def _build_parser(cls) -> argparse.ArgumentParser:
+        """Build the CLI argument parser, caching it on the class so that repeated
+        calls to :py:meth:`Task.parse_args` only parse."""
+        # look in the class's own namespace so subclasses, which may have a
+        # different description or version, don't reuse a parent's parser
+        cached: Optional[argparse.ArgumentParser] = cls.__dict__.get("_parser")
+        if cached is not None:
+            return cached
+
         dhf = argparse.ArgumentDefaultsHelpFormatter
         parser0 = argparse.ArgumentParser(description=cls.description)
         parser0.add_argument(
@@ -563,8 +573,15 @@ class Task(ABC):
 workdir = 'local-output', output = 'local-output/output-payload.json') """,
         )
 
+        cls._parser = parser0
+        return parser0
+
+    @classmethod
+    def parse_args(cls, args: list[str]) -> dict[str, Any]:
+        parser = cls._build_parser()
+
         # turn Namespace into dictionary
-        pargs = vars(parser0.parse_args(args))
+        pargs = vars(parser.parse_args(args))
         # only keep keys that are not None
         pargs = {k: v for k, v in pargs.items() if v is not None}
 
@@ -582,8 +599,8 @@ workdir = 'local-output', output = 'local-output/output-payload.json') """,
                 pargs["output"] = Path(pargs["workdir"]) / "output-payload.json"
 
         if pargs.get("command", None) is None:
-            parser.print_help()
-            sys.exit(0)
+            # print the help for the `run` command and exit
+            parser.parse_args(["run", "--help"])
 
         return pargs
 
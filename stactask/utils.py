@@ -1,7 +1,62 @@
-from typing import Any, Optional
+import re
+from functools import lru_cache
+from typing import Any, NamedTuple, Optional
 
 from jsonpath_ng.ext import parser
 
+# A filter with a single (optional) comparison on one item field, e.g.
+# $[?(@.properties.['s2:processing_baseline'] >= '05.00')]
+_SIMPLE_FILTER = re.compile(
+    r"^\$\[\?\(@(?P<path>(?:\.[A-Za-z_][\w-]*|\.?\['[^'*]+'\])+)"
+    r"(?:\s*(?P<op>==|!=|<=|>=|<|>|=~)\s*(?:'(?P<literal>[^']*)'|[\w.-]+))?\)\]$"
+)
+_PATH_SEGMENT = re.compile(r"\.([A-Za-z_][\w-]*)|\.?\['([^'*]+)'\]")
+
+# sentinels returned by _lookup
+_MISSING = object()
+_UNKNOWN = object()
+
+
+class _SimpleFilter(NamedTuple):
+    keys: tuple[str, ...]
+    op: Optional[str]
+    literal: Optional[str]
+
+
+@lru_cache(maxsize=512)
+def _parse(expr: str) -> Any:
+    """Parse a JSONPath expression, reusing the result for repeated expressions."""
+    return parser.parse(expr)
+
+
+@lru_cache(maxsize=512)
+def _simple_filter(expr: str) -> Optional[_SimpleFilter]:
+    """Break a simple filter expression into the chain of keys it reads from the
+    item, its comparison operator and, if compared against one, the string literal.
+    Returns None if the expression is not simple enough to tell."""
+    match = _SIMPLE_FILTER.match(expr)
+    if match is None:
+        return None
+    keys = tuple(a or b for a, b in _PATH_SEGMENT.findall(match.group("path")))
+    literal = match.group("literal")
+    if literal is not None and "\\" in literal:
+        # leave escape handling to the JSONPath lexer
+        literal = None
+    return _SimpleFilter(keys, match.group("op"), literal)
+
+
+def _lookup(item: dict[str, Any], keys: tuple[str, ...]) -> Any:
+    """Follow keys through nested dicts. Returns _MISSING if a key is absent, or
+    _UNKNOWN if a value that is not a dict is reached first."""
+    value: Any = item
+    for key in keys:
+        if not isinstance(value, dict):
+            return _UNKNOWN
+        if key not in value:
+            return _MISSING
+        value = value[key]
+    return value
+
 
 def stac_jsonpath_match(item: dict[str, Any], expr: str) -> bool:
     """Match jsonpath expression against STAC JSON.
@@ -18,7 +73,19 @@ def stac_jsonpath_match(item: dict[str, Any], expr: str) -> bool:
     Returns:
         Boolean: Returns True if the jsonpath expression matches the STAC Item JSON
     """
-    return len([x.value for x in parser.parse(expr).find([item])]) == 1
+    simple = _simple_filter(expr)
+    if simple is not None:
+        value = _lookup(item, simple.keys)
+        if value is _MISSING:
+            # a filter can never match an item that is missing the field it reads
+            return False
+        if value is not _UNKNOWN and simple.literal is not None:
+            # string equality and regex matches, evaluated as jsonpath_ng does
+            if simple.op == "==":
+                return bool(value == simple.literal)
+            if simple.op == "=~":
+                return isinstance(value, str) and bool(re.search(simple.literal, value))
+    return len([x.value for x in _parse(expr).find([item])]) == 1
 
 
 def find_collection(
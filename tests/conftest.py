@@ -1,10 +1,73 @@
+import os
+import pickle
+import tempfile
+from copy import deepcopy
+from pathlib import Path
+from typing import Any
+
+import orjson
 import pytest
 
+fixtures_path = Path(__file__).parent / "fixtures"
+
+
+def load_fixture(name: str) -> dict[str, Any]:
+    """Load the JSON fixture ``name``.
+
+    If ``STACTASK_FIXTURE_CACHE=1`` is set, the parsed JSON is pickled next to the
+    fixture and reused for as long as it is newer than the JSON file.
+    """
+    filename = fixtures_path / f"{name}.json"
+    if os.environ.get("STACTASK_FIXTURE_CACHE") != "1":
+        fixture = orjson.loads(filename.read_bytes())
+        assert isinstance(fixture, dict)
+        return fixture
+
+    cache = filename.with_suffix(".pkl")
+    if cache.exists() and cache.stat().st_mtime >= filename.stat().st_mtime:
+        try:
+            fixture = pickle.loads(cache.read_bytes())
+            assert isinstance(fixture, dict)
+            return fixture
+        except Exception:
+            # truncated or otherwise unreadable cache; rebuild it below
+            pass
+
+    fixture = orjson.loads(filename.read_bytes())
+    assert isinstance(fixture, dict)
+    # write then rename, so concurrent (xdist) workers never see a partial file
+    fd, tmp = tempfile.mkstemp(dir=cache.parent, suffix=".pkl.tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(pickle.dumps(fixture))
+        os.replace(tmp, cache)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    return fixture
+
+
+@pytest.fixture(scope="session")
+def payload_template() -> dict[str, Any]:
+    """The parsed payload fixture, loaded once per session. Do not mutate it."""
+    return load_fixture("sentinel2-l2a-j2k-payload")
+
+
+@pytest.fixture
+def payload(payload_template: dict[str, Any]) -> dict[str, Any]:
+    return deepcopy(payload_template)
+
 
 def pytest_addoption(parser: pytest.Parser) -> None:
     parser.addoption(
         "--runslow", action="store_true", default=False, help="run slow tests"
     )
+    parser.addoption(
+        "--network",
+        action="store_true",
+        default=False,
+        help="run tests that require network access",
+    )
     parser.addoption(
         "--s3-requester-pays",
         action="store_true",
@@ -15,6 +78,9 @@ def pytest_addoption(parser: pytest.Parser) -> None:
 
 def pytest_configure(config: pytest.Config) -> None:
     config.addinivalue_line("markers", "slow: mark test as slow to run")
+    config.addinivalue_line(
+        "markers", "network: mark test as requiring network access to run"
+    )
     config.addinivalue_line(
         "markers", "s3_requester_pays: mark test as requiring s3 requester pays to run"
     )
@@ -28,6 +94,11 @@ def pytest_collection_modifyitems(
         for item in items:
             if "slow" in item.keywords:
                 item.add_marker(skip_slow)
+    if not config.getoption("--network"):
+        skip_network = pytest.mark.skip(reason="need --network option to run")
+        for item in items:
+            if "network" in item.keywords:
+                item.add_marker(skip_network)
     if not config.getoption("--s3-requester-pays"):
         skip_s3_requestor_pays = pytest.mark.skip(
             reason="need --s3-requester-pays option to run"
@@ -1,11 +1,9 @@
 #!/usr/bin/env python
-import json
+from copy import deepcopy
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
 
-import boto3
 import pytest
-from moto import mock_aws
 from pystac import Asset
 
 from stactask.exceptions import FailedValidation
@@ -13,39 +11,59 @@ from stactask.task import Task
 
 from .tasks import DerivedItemTask, FailValidateTask, NothingTask
 
-testpath = Path(__file__).parent
-cassettepath = testpath / "fixtures" / "cassettes"
+
+@pytest.fixture(scope="module")
+def shared_workdir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    # tasks from the fixtures below share one workdir rather than each creating
+    # (and leaking) its own temporary directory
+    return tmp_path_factory.mktemp("workdir")
 
 
 @pytest.fixture
-def payload() -> dict[str, Any]:
-    filename = testpath / "fixtures" / "sentinel2-l2a-j2k-payload.json"
-    with open(filename) as f:
-        payload = json.loads(f.read())
-    assert isinstance(payload, dict)
-    return payload
+def nothing_task(payload: dict[str, Any], shared_workdir: Path) -> Task:
+    return NothingTask(payload, workdir=shared_workdir, save_workdir=False)
 
 
 @pytest.fixture
-def nothing_task(payload: dict[str, Any]) -> Task:
-    return NothingTask(payload)
+def derived_item_task(payload: dict[str, Any], shared_workdir: Path) -> Task:
+    return DerivedItemTask(payload, workdir=shared_workdir, save_workdir=False)
 
 
-@pytest.fixture
-def derived_item_task(payload: dict[str, Any]) -> Task:
-    return DerivedItemTask(payload)
+@pytest.fixture(scope="module")
+def derived_handler_output(payload_template: dict[str, Any]) -> dict[str, Any]:
+    return DerivedItemTask.handler(deepcopy(payload_template))
 
 
-def test_task_init(nothing_task: Task) -> None:
-    assert len(nothing_task._payload["features"]) == 2
-    assert len(nothing_task.items) == 2
-    assert nothing_task.logger.name == nothing_task.name
-    assert nothing_task._save_workdir is False
+@pytest.fixture
+def mock_s3_bucket() -> Iterator[Any]:
+    # moto is slow to import, so only pay for it when S3 is actually mocked
+    import boto3
+    from moto import mock_aws
+
+    with mock_aws():
+        s3_client = boto3.client("s3")
+        s3_client.create_bucket(
+            Bucket="sentinel-cogs",
+            CreateBucketConfiguration={
+                "LocationConstraint": "us-west-2",
+            },
+        )
+        yield s3_client
+
+
+def test_task_init(payload: dict[str, Any]) -> None:
+    # default arguments, unlike the nothing_task fixture
+    t = NothingTask(payload)
+    assert len(t._payload["features"]) == 2
+    assert len(t.items) == 2
+    assert t.logger.name == t.name
+    assert t._save_workdir is False
+    t.cleanup_workdir()
 
 
-def test_failed_validation(payload: dict[str, Any]) -> None:
+def test_failed_validation(payload_template: dict[str, Any]) -> None:
     with pytest.raises(FailedValidation, match="Extra context"):
-        FailValidateTask(payload)
+        FailValidateTask(payload_template)
 
 
 def test_deprecated_payload_dict(nothing_task: Task) -> None:
@@ -127,12 +145,11 @@ def test_workdir(
     assert workdir.exists() is expected
 
 
-def test_parameters(payload: dict[str, Any]) -> None:
-    nothing_task = NothingTask(payload)
+def test_parameters(payload_template: dict[str, Any], nothing_task: Task) -> None:
     assert nothing_task.process_definition["workflow"] == "cog-archive"
     assert (
         nothing_task.upload_options["path_template"]
-        == payload["process"][0]["upload_options"]["path_template"]
+        == payload_template["process"][0]["upload_options"]["path_template"]
     )
 
 
@@ -155,26 +172,23 @@ def test_post_process(payload: dict[str, Any]) -> None:
     for item in payload_out["features"]:
         assert item["properties"]["foo"] == "bar"
         stac_extensions = item["stac_extensions"]
-        assert item["stac_extensions"] == sorted(stac_extensions)
+        assert all(a <= b for a, b in zip(stac_extensions, stac_extensions[1:]))
 
 
 def test_derived_item(derived_item_task: Task) -> None:
     items = derived_item_task.process(**derived_item_task.parameters)
-    links = [lk for lk in items[0]["links"] if lk["rel"] == "derived_from"]
-    assert len(links) == 1
-    self_link = next(lk for lk in items[0]["links"] if lk["rel"] == "self")
-    assert links[0]["href"] == self_link["href"]
+    links = items[0]["links"]
+    assert sum(1 for lk in links if lk["rel"] == "derived_from") == 1
+    by_rel = {lk["rel"]: lk for lk in links}
+    assert by_rel["derived_from"]["href"] == by_rel["self"]["href"]
 
 
-def test_task_handler(payload: dict[str, Any]) -> None:
-    self_link = next(
-        lk for lk in payload["features"][0]["links"] if lk["rel"] == "self"
-    )
-    output_items = DerivedItemTask.handler(payload)
-    derived_link = next(
-        lk for lk in output_items["features"][0]["links"] if lk["rel"] == "derived_from"
-    )
-    assert derived_link["href"] == self_link["href"]
+def test_task_handler(
+    payload: dict[str, Any], derived_handler_output: dict[str, Any]
+) -> None:
+    self_link = {lk["rel"]: lk for lk in payload["features"][0]["links"]}["self"]
+    by_rel = {lk["rel"]: lk for lk in derived_handler_output["features"][0]["links"]}
+    assert by_rel["derived_from"]["href"] == self_link["href"]
 
 
 def test_parse_no_args() -> None:
@@ -192,34 +206,35 @@ def test_parse_args() -> None:
     assert args["validate"] is True
 
 
-def test_parse_args_deprecated_skip() -> None:
-    args = NothingTask.parse_args("run input --skip-upload --skip-validation".split())
-    assert args["upload"] is False
-    assert args["validate"] is False
-
+def test_parse_args_parser_is_cached() -> None:
+    class VersionedTask(NothingTask):
+        version = "42"
 
-def test_parse_args_no_upload_and_no_validation() -> None:
-    args = NothingTask.parse_args("run input --no-upload --no-validate".split())
-    assert args["upload"] is False
-    assert args["validate"] is False
+    assert NothingTask._build_parser() is NothingTask._build_parser()
+    assert VersionedTask._build_parser() is not NothingTask._build_parser()
 
 
-def test_parse_args_no_upload_and_validation() -> None:
-    args = NothingTask.parse_args("run input --no-upload --validate".split())
+def test_parse_args_deprecated_skip() -> None:
+    args = NothingTask.parse_args("run input --skip-upload --skip-validation".split())
     assert args["upload"] is False
-    assert args["validate"] is True
-
-
-def test_parse_args_upload_and_no_validation() -> None:
-    args = NothingTask.parse_args("run input --upload --no-validate".split())
-    assert args["upload"] is True
     assert args["validate"] is False
 
 
-def test_parse_args_upload_and_validation() -> None:
-    args = NothingTask.parse_args("run input --upload --validate".split())
-    assert args["upload"] is True
-    assert args["validate"] is True
+@pytest.mark.parametrize(
+    "flags,upload,validate",
+    [
+        ("--no-upload --no-validate", False, False),
+        ("--no-upload --validate", False, True),
+        ("--upload --no-validate", True, False),
+        ("--upload --validate", True, True),
+    ],
+)
+def test_parse_args_upload_and_validation(
+    flags: str, upload: bool, validate: bool
+) -> None:
+    args = NothingTask.parse_args(f"run input {flags}".split())
+    assert args["upload"] is upload
+    assert args["validate"] is validate
 
 
 def test_collection_mapping(nothing_task: Task) -> None:
@@ -228,18 +243,8 @@ def test_collection_mapping(nothing_task: Task) -> None:
     }
 
 
-@mock_aws  # type: ignore
+@pytest.mark.usefixtures("mock_s3_bucket")
 def test_s3_upload(nothing_task: Task) -> None:
-    # start S3 mocks
-    s3_client = boto3.client("s3")
-    s3_client.create_bucket(
-        Bucket="sentinel-cogs",
-        CreateBucketConfiguration={
-            "LocationConstraint": "us-west-2",
-        },
-    )
-    # end S3 mocks
-
     item = nothing_task.items.items[0]
     key1_path = nothing_task._workdir / "foo.txt"
     key1_path.write_text("some text")
@@ -1,29 +1,38 @@
-import json
 import os
+import shutil
+from copy import deepcopy
 from pathlib import Path
 from typing import Any
 
 import pytest
 import stac_asset
+from pystac import Item
 
 from stactask.config import DownloadConfig
 
 from .tasks import NothingTask
 
 
-@pytest.fixture
-def item_collection() -> dict[str, Any]:
-    name = "sentinel2-l2a-j2k-payload"
-    filename = Path(__file__).parent / "fixtures" / f"{name}.json"
-    with open(filename) as f:
-        items = json.loads(f.read())
-    assert isinstance(items, dict)
-    return items
+@pytest.fixture(scope="session")
+def downloaded_assets_cache(
+    tmp_path_factory: pytest.TempPathFactory, payload_template: dict[str, Any]
+) -> tuple[Path, Path]:
+    """A workdir holding the first payload item with its ``tileinfo_metadata``
+    asset already downloaded, so the download happens once per session.
+
+    Returns the workdir and the path of the saved item relative to it.
+    """
+    workdir = tmp_path_factory.mktemp("downloaded-assets")
+    t = NothingTask(deepcopy(payload_template), workdir=workdir)
+    item = t.download_item_assets(
+        t.items[0], config=DownloadConfig(include=["tileinfo_metadata"])
+    )
+    return workdir, Path(item.self_href).relative_to(t._workdir)
 
 
-def test_download_nosuch_asset(tmp_path: Path, item_collection: dict[str, Any]) -> None:
+def test_download_nosuch_asset(tmp_path: Path, payload: dict[str, Any]) -> None:
     t = NothingTask(
-        item_collection,
+        payload,
         workdir=tmp_path / "test-task-download-nosuch-asset",
         save_workdir=True,
     )
@@ -32,16 +41,16 @@ def test_download_nosuch_asset(tmp_path: Path, item_collection: dict[str, Any])
     )
 
     # new item has same assets hrefs as old item
-    assert [x.href for x in item.assets.values()] == [
-        x.href for x in t.items[0].assets.values()
-    ]
+    assert {k: v.href for k, v in item.assets.items()} == {
+        k: v.href for k, v in t.items[0].assets.items()
+    }
 
 
 def test_download_asset_dont_keep_existing(
-    tmp_path: Path, item_collection: dict[str, Any]
+    tmp_path: Path, payload: dict[str, Any]
 ) -> None:
     t = NothingTask(
-        item_collection,
+        payload,
         workdir=tmp_path / "test-task-download-nosuch-asset",
         save_workdir=True,
     )
@@ -55,20 +64,21 @@ def test_download_asset_dont_keep_existing(
     assert item.assets == {}
 
 
-# @vcr.use_cassette(str(cassettepath / 'download_assets'))
-def test_download_item_asset(tmp_path: Path, item_collection: dict[str, Any]) -> None:
-    t = NothingTask(item_collection, workdir=tmp_path / "test-task-download-item-asset")
+@pytest.mark.network
+def test_download_item_asset(tmp_path: Path, payload: dict[str, Any]) -> None:
+    t = NothingTask(payload, workdir=tmp_path / "test-task-download-item-asset")
     item = t.download_item_assets(
         t.items[0], config=DownloadConfig(include=["tileinfo_metadata"])
     )
     assert Path(item.assets["tileinfo_metadata"].get_absolute_href()).is_file()
 
 
+@pytest.mark.network
 def test_download_keep_original_filenames(
-    tmp_path: Path, item_collection: dict[str, Any]
+    tmp_path: Path, payload: dict[str, Any]
 ) -> None:
     t = NothingTask(
-        item_collection,
+        payload,
         workdir=tmp_path / "test-task-download-item-asset",
     )
     item = t.download_item_assets(
@@ -77,26 +87,30 @@ def test_download_keep_original_filenames(
             include=["tileinfo_metadata"],
             file_name_strategy=stac_asset.FileNameStrategy.FILE_NAME,
         ),
-    ).to_dict()
-    fname = item["assets"]["tileinfo_metadata"]["href"]
-    filename = Path(fname)
+    )
+    filename = Path(item.assets["tileinfo_metadata"].get_absolute_href())
     assert filename.name == "tileInfo.json"
 
 
+@pytest.mark.network
 def test_download_item_asset_local(
-    tmp_path: Path, item_collection: dict[str, Any]
+    tmp_path: Path,
+    payload: dict[str, Any],
+    downloaded_assets_cache: tuple[Path, Path],
 ) -> None:
-    t = NothingTask(item_collection, workdir=tmp_path / "test-task-download-item-asset")
-    item = t.download_item_assets(
-        t.items[0], config=DownloadConfig(include=["tileinfo_metadata"])
-    )
+    cache, item_path = downloaded_assets_cache
+    workdir = tmp_path / "test-task-download-item-asset"
+    # hard links avoid copying the cached bytes; the test never modifies them
+    shutil.copytree(cache, workdir, copy_function=os.link)
+    t = NothingTask(payload, workdir=workdir)
+    item = Item.from_file(str(workdir / item_path))
 
     assert (
         Path(os.path.dirname(item.self_href)) / item.assets["tileinfo_metadata"].href
     ).is_file()
 
-    # Downloaded to local, as in prev test.
-    # With the asset hrefs updated by the prev download, we "download" again to subdir
+    # Downloaded to local by the session cache.
+    # With the asset hrefs updated by that download, we "download" again to subdir
     item = t.download_item_assets(
         item=item,
         config=DownloadConfig(include=["tileinfo_metadata"]),
@@ -108,10 +122,10 @@ def test_download_item_asset_local(
     assert Path(href).is_file()
 
 
-# @vcr.use_cassette(str(cassettepath / 'download_assets'))
-def test_download_item_assets(tmp_path: Path, item_collection: dict[str, Any]) -> None:
+@pytest.mark.network
+def test_download_item_assets(tmp_path: Path, payload: dict[str, Any]) -> None:
     t = NothingTask(
-        item_collection,
+        payload,
         workdir=tmp_path / "test-task-download-item-assets",
         save_workdir=True,
     )
@@ -124,10 +138,11 @@ def test_download_item_assets(tmp_path: Path, item_collection: dict[str, Any]) -
     assert Path(item.assets["granule_metadata"].get_absolute_href()).is_file()
 
 
-def test_download_items_assets(tmp_path: Path, item_collection: dict[str, Any]) -> None:
+@pytest.mark.network
+def test_download_items_assets(tmp_path: Path, payload: dict[str, Any]) -> None:
     asset_key = "tileinfo_metadata"
     t = NothingTask(
-        item_collection,
+        payload,
         workdir=tmp_path / "test-task-download-items-assets",
         save_workdir=True,
     )
@@ -138,11 +153,12 @@ def test_download_items_assets(tmp_path: Path, item_collection: dict[str, Any])
         assert Path(item.assets[asset_key].get_absolute_href()).is_file()
 
 
-# @vcr.use_cassette(str(cassettepath / 'download_assets'))
+@pytest.mark.network
 @pytest.mark.s3_requester_pays
-def test_download_large_asset(tmp_path: Path, item_collection: dict[str, Any]) -> None:
+@pytest.mark.xdist_group("s3_requester_pays")
+def test_download_large_asset(tmp_path: Path, payload: dict[str, Any]) -> None:
     t = NothingTask(
-        item_collection,
+        payload,
         workdir=tmp_path / "test-task-download-assets",
         save_workdir=True,
     )
@@ -1,4 +1,9 @@
-from stactask.utils import find_collection, stac_jsonpath_match
+from stactask.utils import (
+    _parse,
+    _simple_filter,
+    find_collection,
+    stac_jsonpath_match,
+)
 
 
 def test_stac_jsonpath_match() -> None:
@@ -22,6 +27,35 @@ def test_stac_jsonpath_match() -> None:
     )
 
 
+def test_stac_jsonpath_match_reuses_parsed_expression() -> None:
+    expr = "$[?(@.id >= 'cached')]"
+    assert stac_jsonpath_match({"id": "cached"}, expr)
+    hits = _parse.cache_info().hits
+    assert not stac_jsonpath_match({"id": "a"}, expr)
+    assert _parse.cache_info().hits == hits + 1
+
+
+def test_stac_jsonpath_match_missing_key() -> None:
+    expr = "$[?(@.properties.['s2:processing_baseline'] >= '05.00')]"
+    simple = _simple_filter(expr)
+    assert simple is not None
+    assert simple.keys == ("properties", "s2:processing_baseline")
+    assert not stac_jsonpath_match({"id": "1"}, expr)
+    assert not stac_jsonpath_match({"properties": {}}, expr)
+    assert _simple_filter("$[?(@.id == '1' & @.collection == 'a')]") is None
+
+
+def test_stac_jsonpath_match_simple_filter() -> None:
+    misses = _parse.cache_info().misses
+    assert stac_jsonpath_match({"id": "S2A_1"}, "$[?(@.id =~ 'S2[AB]_')]")
+    assert not stac_jsonpath_match({"id": "LC08_1"}, "$[?(@.id =~ 'S2[AB]_')]")
+    assert not stac_jsonpath_match({"id": 1}, "$[?(@.id =~ '1')]")
+    assert stac_jsonpath_match({"id": "simple"}, "$[?(@.id == 'simple')]")
+    assert not stac_jsonpath_match({"id": "other"}, "$[?(@.id == 'simple')]")
+    # none of the above needed the JSONPath parser
+    assert _parse.cache_info().misses == misses
+
+
 def test_find_collection() -> None:
     assert find_collection({"a": "$[?(@.id =~ '.*')]"}, {"id": "1"}) == "a"
     assert (